@@ -6,17 +6,18 @@ A professional FastAPI service for scraping grocery store product data
 
 from fastapi import FastAPI, HTTPException
 from fastapi.middleware.cors import CORSMiddleware
-from pydantic import BaseModel
-from typing import List, Optional
+from fastapi.responses import ORJSONResponse
+from typing import List
 import asyncio
 import os
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 import logging
 
 # Import our scraper modules
 from scraper.core import GroceryScraper
-from scraper.models import ScrapeRequest, ScrapeResponse, ProductListing, StoreInfo
-from scraper.config import SUPPORTED_STORES
+from scraper.models import ScrapeRequest, ScrapeResponse, StoreInfo
+from scraper.config import SUPPORTED_STORES, canonical_store_id
 
 # Configure logging
 logging.basicConfig(level=logging.INFO)
@@ -28,7 +29,8 @@ app = FastAPI(
     description="Professional API for scraping real grocery store product data",
     version="1.0.0",
     docs_url="/docs",
-    redoc_url="/redoc"
+    redoc_url="/redoc",
+    default_response_class=ORJSONResponse
 )
 
 # CORS middleware
@@ -43,29 +45,59 @@ app.add_middleware(
 # Initialize scraper
 scraper = GroceryScraper()
 
+# Root endpoint payload, static for the lifetime of the process
+API_INFO = {
+    "name": "Grocery Scraper API",
+    "version": "1.0.0",
+    "description": "Professional API for scraping real grocery store product data",
+    "docs": "/docs",
+    "supported_stores": len(SUPPORTED_STORES),
+    "working_stores": ["gianteagle", "wegmans", "aldi"],
+    "endpoints": {
+        "scrape": "/scrape",
+        "stores": "/stores",
+        "health": "/health",
+        "test": "/test/{store}"
+    }
+}
+
+# Each scrape drives its own Chrome instance, so bound how many run at once
+scrape_executor = ThreadPoolExecutor(
+    max_workers=int(os.environ.get("SCRAPER_CONCURRENCY", "4")),
+    thread_name_prefix="scrape"
+)
+
+# Store listing is static, so build it once instead of on every request
+STORE_INFO = [
+    StoreInfo(
+        store_id=store_id,
+        store_name=info["name"],
+        supported=True,
+        status=info["status"],
+        description=info["description"]
+    )
+    for store_id, info in SUPPORTED_STORES.items()
+]
+
 @app.on_event("startup")
 async def startup_event():
     """Initialize the scraper on startup"""
     logger.info("🚀 Starting Grocery Scraper API...")
-    logger.info(f"🏪 Supported stores: {list(SUPPORTED_STORES.keys())}")
+    logger.info("🏪 Supported stores: %s", list(SUPPORTED_STORES))
+    
+    # Probe Selenium once off the event loop; the result is cached, so readiness
+    # checks in request handlers never block the loop launching a browser
+    await asyncio.get_event_loop().run_in_executor(scrape_executor, scraper.selenium_available)
+
+@app.on_event("shutdown")
+async def shutdown_event():
+    """Stop the scrape worker threads on shutdown"""
+    scrape_executor.shutdown(wait=False, cancel_futures=True)
 
 @app.get("/")
 async def root():
     """Root endpoint with API information"""
-    return {
-        "name": "Grocery Scraper API",
-        "version": "1.0.0",
-        "description": "Professional API for scraping real grocery store product data",
-        "docs": "/docs",
-        "supported_stores": len(SUPPORTED_STORES),
-        "working_stores": ["gianteagle", "wegmans", "aldi"],
-        "endpoints": {
-            "scrape": "/scrape",
-            "stores": "/stores",
-            "health": "/health",
-            "test": "/test/{store}"
-        }
-    }
+    return API_INFO
 
 @app.get("/health")
 async def health_check():
@@ -82,16 +114,7 @@ async def health_check():
 @app.get("/stores", response_model=List[StoreInfo])
 async def get_supported_stores():
     """Get list of supported stores"""
-    return [
-        StoreInfo(
-            store_id=store_id,
-            store_name=info["name"],
-            supported=True,
-            status=info["status"],
-            description=info["description"]
-        )
-        for store_id, info in SUPPORTED_STORES.items()
-    ]
+    return STORE_INFO
 
 @app.post("/scrape", response_model=ScrapeResponse)
 async def scrape_products(request: ScrapeRequest):
@@ -103,6 +126,13 @@ async def scrape_products(request: ScrapeRequest):
     - **zipcode**: ZIP code for store location
     """
     
+    # Validate query
+    if not request.query:
+        raise HTTPException(
+            status_code=400,
+            detail="Query must not be empty."
+        )
+    
     # Validate store
     if request.store not in SUPPORTED_STORES:
         raise HTTPException(
@@ -117,12 +147,12 @@ async def scrape_products(request: ScrapeRequest):
             detail="Scraper not ready. Please check system dependencies."
         )
     
-    logger.info(f"🔍 Scraping {request.store} for '{request.query}' in {request.zipcode}")
+    logger.info("🔍 Scraping %s for '%s' in %s", request.store, request.query, request.zipcode)
     
     try:
         # Perform scraping
         results = await asyncio.get_event_loop().run_in_executor(
-            None,
+            scrape_executor,
             scraper.scrape_store,
             request.query,
             request.store,
@@ -132,7 +162,7 @@ async def scrape_products(request: ScrapeRequest):
         return results
         
     except Exception as e:
-        logger.error(f"❌ Scraping failed: {str(e)}")
+        logger.error("❌ Scraping failed: %s", e)
         raise HTTPException(
             status_code=500,
             detail=f"Scraping failed: {str(e)}"
@@ -147,6 +177,7 @@ async def scrape_products_get(query: str, store: str, zipcode: str):
 @app.get("/test/{store}")
 async def test_store(store: str):
     """Quick test endpoint for a specific store"""
+    store = canonical_store_id(store)
     if store not in SUPPORTED_STORES:
         raise HTTPException(
             status_code=400, 
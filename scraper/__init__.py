@@ -5,7 +5,7 @@ Professional web scraping for grocery stores
 
 from .core import GroceryScraper
 from .models import ScrapeRequest, ScrapeResponse, ProductListing, StoreInfo
-from .config import SUPPORTED_STORES
+from .config import SUPPORTED_STORES, canonical_store_id
 
 __version__ = "1.0.0"
-__all__ = ["GroceryScraper", "ScrapeRequest", "ScrapeResponse", "ProductListing", "StoreInfo", "SUPPORTED_STORES"]
+__all__ = ["GroceryScraper", "ScrapeRequest", "ScrapeResponse", "ProductListing", "StoreInfo", "SUPPORTED_STORES", "canonical_store_id"]
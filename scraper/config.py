@@ -160,11 +160,21 @@ SUPPORTED_STORES = {
     }
 }
 
+# Characters dropped when canonicalizing a store name to its SUPPORTED_STORES key
+_STORE_ID_STRIP = str.maketrans("", "", " _-'")
+
+def canonical_store_id(store: str) -> str:
+    """Normalize a store name to its SUPPORTED_STORES key (e.g. "Giant Eagle" -> "gianteagle")"""
+    return store.strip().lower().translate(_STORE_ID_STRIP)
+
 # Scraper settings
 SCRAPER_CONFIG = {
     "timeout": 30,
     "headless": True,
     "user_agent": "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36",
     "implicit_wait": 10,
-    "page_load_timeout": 30
+    "page_load_timeout": 30,
+    "max_products": 20,  # product tiles extracted per page
+    "cache_ttl": 300,  # seconds a successful scrape is served from cache
+    "cache_max_entries": 256
 }
@@ -4,22 +4,26 @@ Enhanced core scraper functionality with LLM integration
 
 import time
 import random
+import functools
 import logging
 import os
 import json
 import re
-from typing import List, Dict, Any
+import threading
+from collections import OrderedDict
+from concurrent.futures import Future
+from typing import List, Dict, Any, Optional
 from urllib.parse import quote
 from datetime import datetime
 
+import soupsieve
 from bs4 import BeautifulSoup
 from selenium import webdriver
 from selenium.webdriver.chrome.options import Options
 from selenium.webdriver.chrome.service import Service
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
-from selenium.webdriver.support import expected_conditions as EC
-from selenium.common.exceptions import TimeoutException, NoSuchElementException
+from selenium.common.exceptions import StaleElementReferenceException, WebDriverException
 from webdriver_manager.chrome import ChromeDriverManager
 
 from .models import ScrapeResponse, ProductListing
@@ -27,12 +31,96 @@ from .config import SUPPORTED_STORES, SCRAPER_CONFIG
 
 logger = logging.getLogger(__name__)
 
+# Prefer the C-backed lxml parser for page source, falling back to the stdlib parser
+try:
+    import lxml  # noqa: F401
+    HTML_PARSER = "lxml"
+except ImportError:
+    HTML_PARSER = "html.parser"
+
 # User agents for anti-detection
-USER_AGENTS = [
+USER_AGENTS = (
     "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/137.0.0.0 Safari/537.36",
     "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/137.0.0.0 Safari/537.36",
     "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/605.1.15 (KHTML, like Gecko) Version/17.3 Safari/605.1.15"
-]
+)
+
+# Chrome arguments shared by every driver; headless mode and user agent are added per driver
+CHROME_ARGUMENTS = (
+    "--no-sandbox",
+    "--disable-dev-shm-usage",
+    "--disable-gpu",
+    "--disable-blink-features=AutomationControlled",
+    "--disable-extensions",
+    "--disable-plugins-discovery",
+    "--disable-web-security",
+    "--window-size=1920,1080"
+)
+
+# Per-store CSS selectors compiled once at import, so matching every product tile
+# does not go back through selector parsing and the compile cache
+COMPILED_SELECTORS = {
+    store_id: {
+        field: tuple(soupsieve.compile(selector) for selector in selectors)
+        for field, selectors in store_config["selectors"].items()
+    }
+    for store_id, store_config in SUPPORTED_STORES.items()
+}
+
+# Cookie consent buttons in priority order; specific id/class hooks come before
+# broad data-testid containers and button text
+COOKIE_BUTTON_XPATHS = (
+    "//button[contains(@id, 'accept')]",
+    "//button[contains(@class, 'accept')]",
+    "//*[contains(@data-testid, 'accept')]",
+    "//button[contains(., 'Accept')]",
+    "//button[normalize-space(.)='OK']"
+)
+
+# Titles containing any of these are navigation elements, ads, etc.
+INVALID_TITLE_KEYWORDS = (
+    "sort by", "filter", "menu", "navigation", "advertisement",
+    "sign in", "cart", "checkout", "search", "category"
+)
+
+# Single alternation so each title is scanned once instead of once per keyword
+INVALID_TITLE_PATTERN = re.compile("|".join(map(re.escape, INVALID_TITLE_KEYWORDS)), re.IGNORECASE)
+
+# Tags whose contents never hold product text, stripped before LLM conversion
+NON_CONTENT_TAGS = ["script", "style", "noscript", "svg", "template", "iframe"]
+
+# Price text must contain a currency sign or a digit
+PRICE_TEXT_PATTERN = re.compile(r'[$\d]')
+
+# Patterns used to repair LLM JSON output, compiled once at import
+JSON_BLOCK_PATTERN = re.compile(r'(?:json)?\s*(\{.*\})\s*', re.DOTALL)
+TRAILING_BRACE_COMMA_PATTERN = re.compile(r',\s*}')
+TRAILING_BRACKET_COMMA_PATTERN = re.compile(r',\s*]')
+UNQUOTED_KEY_PATTERN = re.compile(r'([{,]\s*)(\w+)(\s*:)')
+
+def _is_json_validate_failed(error) -> bool:
+    """Whether a Groq 400 is JSON mode rejecting the model's output"""
+    body = error.body if isinstance(error.body, dict) else {}
+    details = body.get("error", body)
+    return isinstance(details, dict) and details.get("code") == "json_validate_failed"
+
+
+def _find_cookie_button(driver):
+    """Return the first displayed, enabled cookie button in priority order, or False"""
+    for xpath in COOKIE_BUTTON_XPATHS:
+        for element in driver.find_elements(By.XPATH, xpath):
+            if element.is_displayed() and element.is_enabled():
+                return element
+    return False
+
+
+@functools.lru_cache(maxsize=1)
+def _chromedriver_path() -> str:
+    """Resolve the chromedriver binary once per process instead of once per driver"""
+    chromedriver_path = os.environ.get('CHROMEDRIVER_PATH', '/usr/local/bin/chromedriver')
+    if os.path.exists(chromedriver_path):
+        return chromedriver_path
+    return ChromeDriverManager().install()
 
 class GroceryScraper:
     """Enhanced grocery store scraper with LLM integration"""
@@ -40,6 +128,11 @@ class GroceryScraper:
     def __init__(self):
         self.driver = None
         self._selenium_available = None
+        self._llm_client = None
+        self._cache = OrderedDict()
+        # Re-entrant so scrape_store can re-check the cache while holding it
+        self._cache_lock = threading.RLock()
+        self._in_flight = {}
     
     def selenium_available(self) -> bool:
         """Check if Selenium and Chrome are available"""
@@ -54,7 +147,7 @@ class GroceryScraper:
             else:
                 self._selenium_available = False
         except Exception as e:
-            logger.error(f"Selenium not available: {e}")
+            logger.error("Selenium not available: %s", e)
             self._selenium_available = False
         
         return self._selenium_available
@@ -74,23 +167,13 @@ class GroceryScraper:
                 options.add_argument("--headless=new")
             
             # Enhanced anti-detection options
-            options.add_argument("--no-sandbox")
-            options.add_argument("--disable-dev-shm-usage")
-            options.add_argument("--disable-gpu")
-            options.add_argument("--disable-blink-features=AutomationControlled")
+            for argument in CHROME_ARGUMENTS:
+                options.add_argument(argument)
             options.add_experimental_option("excludeSwitches", ["enable-automation"])
             options.add_experimental_option('useAutomationExtension', False)
-            options.add_argument("--disable-extensions")
-            options.add_argument("--disable-plugins-discovery")
-            options.add_argument("--disable-web-security")
-            options.add_argument("--window-size=1920,1080")
             
             # Setup service
-            chromedriver_path = os.environ.get('CHROMEDRIVER_PATH', '/usr/local/bin/chromedriver')
-            if os.path.exists(chromedriver_path):
-                service = Service(chromedriver_path)
-            else:
-                service = Service(ChromeDriverManager().install())
+            service = Service(_chromedriver_path())
             
             driver = webdriver.Chrome(service=service, options=options)
             
@@ -112,7 +195,7 @@ class GroceryScraper:
             except ImportError:
                 logger.warning("⚠️ selenium-stealth not available, using basic setup")
             except Exception as e:
-                logger.warning(f"⚠️ Error applying stealth: {e}")
+                logger.warning("⚠️ Error applying stealth: %s", e)
             
             # Execute script to hide automation
             driver.execute_script("Object.defineProperty(navigator, 'webdriver', {get: () => undefined})")
@@ -120,15 +203,18 @@ class GroceryScraper:
             return driver
             
         except Exception as e:
-            logger.error(f"Failed to setup Chrome driver: {e}")
+            logger.error("Failed to setup Chrome driver: %s", e)
             return None
     
-    def _extract_with_llm(self, html: str, query: str, store_id: str, zipcode: str) -> List[Dict]:
-        """Extract products using LLM (Groq API)"""
+    def _extract_with_llm(self, soup: BeautifulSoup, query: str, store_id: str, zipcode: str) -> List[Dict]:
+        """Extract products using LLM (Groq API)
+        
+        Non-content tags are removed from ``soup`` in place before conversion.
+        """
         try:
             # Import LLM dependencies
             import html2text
-            from groq import Groq
+            from groq import BadRequestError
             
             logger.info("🤖 Using LLM to extract product data...")
             
@@ -136,22 +222,24 @@ class GroceryScraper:
             converter = html2text.HTML2Text()
             converter.ignore_links = False
             converter.ignore_images = True
-            markdown = converter.handle(html)
+            # Reuse the parsed page and drop markup with no product text, so the
+            # converter only walks the visible body instead of the full page source
+            for tag in soup(NON_CONTENT_TAGS):
+                tag.decompose()
+            markdown = converter.handle(str(soup.body or soup))
             
             # Trim to token limit (rough estimate: 4 chars = 1 token)
             max_chars = 8000
             if len(markdown) > max_chars:
                 markdown = markdown[:max_chars]
-                logger.info(f"⚠️ Trimmed markdown to {max_chars} characters")
+                logger.info("⚠️ Trimmed markdown to %d characters", max_chars)
             
             # Setup Groq client
-            api_key = os.environ.get("GROQ_API_KEY")
-            if not api_key:
+            client = self._get_llm_client()
+            if client is None:
                 logger.error("❌ No GROQ_API_KEY environment variable found")
                 return []
             
-            client = Groq(api_key=api_key)
-            
             # Create system message
             system_message = f"""You are extracting grocery products from a {store_id} store webpage.
 Search query: "{query}"
@@ -181,124 +269,151 @@ Rules:
 - Return valid JSON only, no extra text"""
 
             # Make API call
-            completion = client.chat.completions.create(
-                messages=[
+            request = {
+                "messages": [
                     {"role": "system", "content": system_message},
                     {"role": "user", "content": markdown}
                 ],
-                model="llama3-8b-8192",
-                temperature=0.1
-            )
+                "model": "llama3-8b-8192",
+                "temperature": 0.1
+            }
+            try:
+                # JSON mode usually makes the reply parse directly, skipping the repair pass
+                completion = client.chat.completions.create(
+                    **request,
+                    response_format={"type": "json_object"}
+                )
+            except BadRequestError as e:
+                # Only Groq's own JSON-mode validation failure is worth a plain-mode
+                # retry; any other 400 (prompt too long, bad model) would fail again
+                if not _is_json_validate_failed(e):
+                    raise
+                logger.warning("⚠️ JSON-mode extraction rejected, retrying without it: %s", e)
+                completion = client.chat.completions.create(**request)
             
             response = completion.choices[0].message.content
             logger.info("✅ Received LLM response")
             
-            # Clean and parse JSON response
-            response = self._clean_json_response(response)
-            parsed = json.loads(response)
+            # Parse JSON response, only running the repair pass when it is malformed
+            # (plain-mode replies may wrap the object in prose or trailing commas)
+            try:
+                parsed = json.loads(response)
+            except json.JSONDecodeError:
+                parsed = json.loads(self._clean_json_response(response))
             
             products = parsed.get("listings", [])
-            logger.info(f"✅ LLM extracted {len(products)} products")
+            logger.info("✅ LLM extracted %d products", len(products))
             
             return products
             
         except ImportError as e:
-            logger.error(f"❌ Missing LLM dependencies: {e}")
+            logger.error("❌ Missing LLM dependencies: %s", e)
             return []
         except json.JSONDecodeError as e:
-            logger.error(f"❌ Failed to parse LLM JSON response: {e}")
+            logger.error("❌ Failed to parse LLM JSON response: %s", e)
             return []
         except Exception as e:
-            logger.error(f"❌ LLM extraction failed: {e}")
+            logger.error("❌ LLM extraction failed: %s", e)
             return []
     
+    def _get_llm_client(self):
+        """Return a shared Groq client so its HTTP connection pool is reused across calls"""
+        if self._llm_client is None:
+            from groq import Groq
+            
+            api_key = os.environ.get("GROQ_API_KEY")
+            if not api_key:
+                return None
+            
+            self._llm_client = Groq(api_key=api_key)
+        
+        return self._llm_client
+    
     def _clean_json_response(self, response: str) -> str:
         """Clean up common JSON formatting issues in LLM responses"""
         # Extract JSON from markdown code blocks if present
-        json_match = re.search(r'(?:json)?\s*(\{.*\})\s*', response, re.DOTALL)
+        json_match = JSON_BLOCK_PATTERN.search(response)
         if json_match:
             response = json_match.group(1)
         
         # Fix trailing commas
-        response = re.sub(r',\s*}', '}', response)
-        response = re.sub(r',\s*]', ']', response)
+        response = TRAILING_BRACE_COMMA_PATTERN.sub('}', response)
+        response = TRAILING_BRACKET_COMMA_PATTERN.sub(']', response)
         
         # Fix missing quotes around keys (basic cases)
-        response = re.sub(r'([{,]\s*)(\w+)(\s*:)', r'\1"\2"\3', response)
+        response = UNQUOTED_KEY_PATTERN.sub(r'\1"\2"\3', response)
         
         return response.strip()
     
-    def _extract_products_traditional(self, soup: BeautifulSoup, store_config: Dict) -> List[Dict]:
-        """Traditional CSS selector-based extraction"""
+    def _extract_products_traditional(self, soup: BeautifulSoup, selectors: Dict[str, tuple]) -> List[Dict]:
+        """Traditional CSS selector-based extraction using a store's compiled selectors"""
         products = []
         
         # Try different product selectors
-        for selector in store_config["selectors"]["products"]:
+        for selector in selectors["products"]:
             try:
-                elements = soup.select(selector)
+                # Stop matching once enough candidates are found instead of walking the whole page
+                elements = selector.select(soup, limit=SCRAPER_CONFIG['max_products'])
                 if elements:
-                    logger.info(f"✅ Found {len(elements)} products with selector: {selector}")
+                    logger.info("✅ Found %d products with selector: %s", len(elements), selector.pattern)
                     
-                    for element in elements[:20]:  # Limit to first 20
-                        product_data = self._extract_product_data(element, store_config)
-                        if self._is_valid_product(product_data):
-                            products.append(product_data)
+                    products = self._dedupe_products(
+                        product_data
+                        for element in elements
+                        if self._is_valid_product(product_data := self._extract_product_data(element, selectors))
+                    )
                     
                     if products:
                         break
                         
             except Exception as e:
-                logger.warning(f"Selector {selector} failed: {e}")
+                logger.warning("Selector %s failed: %s", selector.pattern, e)
                 continue
         
         return products
     
-    def _extract_product_data(self, element, store_config: Dict) -> Dict[str, Any]:
-        """Extract product data from a DOM element using CSS selectors"""
-        product_data = {}
-        
+    def _extract_product_data(self, element, selectors: Dict[str, tuple]) -> Dict[str, Any]:
+        """Extract product data from a DOM element using compiled CSS selectors"""
         # Extract title
         title = "Unknown Product"
-        for selector in store_config["selectors"]["title"]:
+        for selector in selectors["title"]:
             try:
-                title_elem = element.select_one(selector)
-                if title_elem and title_elem.get_text(strip=True):
-                    title = title_elem.get_text(strip=True)
+                title_elem = selector.select_one(element)
+                title_text = title_elem.get_text(strip=True) if title_elem else ""
+                if title_text:
+                    title = title_text
                     break
-            except:
+            except Exception:
                 continue
         
         # Extract price
         price = "Price not available"
-        for selector in store_config["selectors"]["price"]:
+        for selector in selectors["price"]:
             try:
-                price_elem = element.select_one(selector)
-                if price_elem and price_elem.get_text(strip=True):
-                    price_text = price_elem.get_text(strip=True)
-                    if '$' in price_text or any(char.isdigit() for char in price_text):
+                price_elem = selector.select_one(element)
+                price_text = price_elem.get_text(strip=True) if price_elem else ""
+                if price_text:
+                    if PRICE_TEXT_PATTERN.search(price_text):
                         price = price_text
                         break
-            except:
+            except Exception:
                 continue
         
         # Extract image
         image_url = ""
-        for selector in store_config["selectors"]["image"]:
+        for selector in selectors["image"]:
             try:
-                img_elem = element.select_one(selector)
+                img_elem = selector.select_one(element)
                 if img_elem:
                     image_url = img_elem.get('src') or img_elem.get('data-src') or ""
                     if image_url:
                         break
-            except:
+            except Exception:
                 continue
         
-        # Extract brand from title
-        brand = "Unknown Brand"
-        if title:
-            words = title.split()
-            if len(words) > 0:
-                brand = words[0]
+        # Extract brand from title (only the first word is needed, so split it off alone)
+        words = title.split(maxsplit=1)
+        brand = words[0] if words else "Unknown Brand"
         
         return {
             "title": title,
@@ -311,26 +426,117 @@ Rules:
             "description": title
         }
     
+    def _dedupe_products(self, products) -> List[Dict]:
+        """Drop repeated products (same title and price), e.g. nested tiles matched by a broad selector"""
+        seen = set()
+        unique = []
+        for product_data in products:
+            key = (product_data.get("title"), product_data.get("price"))
+            if key not in seen:
+                seen.add(key)
+                unique.append(product_data)
+        
+        return unique
+    
     def _is_valid_product(self, product_data: Dict[str, Any]) -> bool:
         """Validate if extracted data represents a real product"""
-        title = product_data.get("title", "").lower()
-        
-        # Filter out navigation elements, ads, etc.
-        invalid_keywords = [
-            "sort by", "filter", "menu", "navigation", "advertisement",
-            "sign in", "cart", "checkout", "search", "category"
-        ]
+        title = product_data.get("title", "")
         
-        if any(keyword in title for keyword in invalid_keywords):
+        # Must have a reasonable title length (checked first as it is the cheapest test)
+        if len(title) < 3 or len(title) > 200:
             return False
         
-        # Must have a reasonable title length
-        if len(title) < 3 or len(title) > 200:
+        # Filter out navigation elements, ads, etc.
+        if INVALID_TITLE_PATTERN.search(title):
             return False
         
         return True
     
     def scrape_store(self, query: str, store_id: str, zipcode: str) -> ScrapeResponse:
+        """Scrape a store, serving repeat queries from the response cache"""
+        cache_key = self._cache_key(query, store_id, zipcode)
+        cached = self._cache_get(cache_key)
+        if cached is not None:
+            logger.info("♻️ Cache hit for %s '%s' in %s", store_id, query, zipcode)
+            return self._for_zipcode(cached, zipcode)
+        
+        # Identical concurrent requests wait on the first one instead of opening their own browser
+        with self._cache_lock:
+            # A leader may have cached its result and left since the check above
+            cached = self._cache_get(cache_key)
+            if cached is not None:
+                return self._for_zipcode(cached, zipcode)
+            
+            pending = self._in_flight.get(cache_key)
+            is_leader = pending is None
+            if is_leader:
+                pending = self._in_flight[cache_key] = Future()
+        
+        if not is_leader:
+            logger.info("⏳ Joining in-flight scrape for %s '%s' in %s", store_id, query, zipcode)
+            return self._for_zipcode(pending.result(), zipcode)
+        
+        try:
+            response = self._scrape_store(query, store_id, zipcode)
+            
+            # Only scrapes that produced listings are cached so failures (including
+            # pages where every product failed validation) are retried
+            if response.success and response.listings:
+                self._cache_set(cache_key, response)
+            
+            pending.set_result(response)
+            return response
+        except BaseException as e:
+            pending.set_exception(e)
+            raise
+        finally:
+            with self._cache_lock:
+                del self._in_flight[cache_key]
+    
+    def _cache_key(self, query: str, store_id: str, zipcode: str) -> tuple:
+        """Build the cache key, leaving out the zipcode for stores whose search URL ignores it"""
+        store_config = SUPPORTED_STORES.get(store_id)
+        if store_config and "{zipcode}" not in store_config["base_url"]:
+            return (store_id, query, None)
+        return (store_id, query, zipcode)
+    
+    def _for_zipcode(self, response: ScrapeResponse, zipcode: str) -> ScrapeResponse:
+        """Re-label a shared response (scraped for another zipcode) with the requested zipcode"""
+        if response.zipcode == zipcode:
+            return response
+        
+        return response.model_copy(update={
+            "zipcode": zipcode,
+            "listings": [
+                listing.model_copy(update={"store_zipcode": zipcode})
+                for listing in response.listings
+            ]
+        })
+    
+    def _cache_get(self, key) -> Optional[ScrapeResponse]:
+        """Return a cached response, or None if missing or expired"""
+        with self._cache_lock:
+            entry = self._cache.get(key)
+            if entry is None:
+                return None
+            
+            expires_at, response = entry
+            if time.monotonic() >= expires_at:
+                del self._cache[key]
+                return None
+            
+            self._cache.move_to_end(key)
+            return response
+    
+    def _cache_set(self, key, response: ScrapeResponse):
+        """Store a response, evicting the least recently used entries past the size cap"""
+        with self._cache_lock:
+            self._cache[key] = (time.monotonic() + SCRAPER_CONFIG['cache_ttl'], response)
+            self._cache.move_to_end(key)
+            while len(self._cache) > SCRAPER_CONFIG['cache_max_entries']:
+                self._cache.popitem(last=False)
+    
+    def _scrape_store(self, query: str, store_id: str, zipcode: str) -> ScrapeResponse:
         """Enhanced scrape with LLM fallback"""
         
         if store_id not in SUPPORTED_STORES:
@@ -345,6 +551,19 @@ Rules:
                 timestamp=datetime.now()
             )
         
+        # A blank query cannot match anything, so skip launching a browser for it
+        if not query.strip():
+            return ScrapeResponse(
+                success=False,
+                store=store_id,
+                query=query,
+                zipcode=zipcode,
+                result_count=0,
+                listings=[],
+                error="Query must not be empty",
+                timestamp=datetime.now()
+            )
+        
         store_config = SUPPORTED_STORES[store_id]
         
         # Setup driver
@@ -364,7 +583,7 @@ Rules:
         try:
             # Navigate to search page
             search_url = store_config["base_url"].format(query=quote(query), zipcode=zipcode)
-            logger.info(f"🌐 Navigating to: {search_url}")
+            logger.info("🌐 Navigating to: %s", search_url)
             
             driver.get(search_url)
             time.sleep(3)
@@ -377,21 +596,21 @@ Rules:
             
             # Get page source and parse
             html = driver.page_source
-            soup = BeautifulSoup(html, 'html.parser')
+            soup = BeautifulSoup(html, HTML_PARSER)
             
             # Try traditional extraction first
             logger.info("🔍 Trying traditional CSS selector extraction...")
-            products = self._extract_products_traditional(soup, store_config)
+            products = self._extract_products_traditional(soup, COMPILED_SELECTORS[store_id])
             
             # If traditional extraction fails or finds few products, use LLM
             if len(products) < 3:
                 logger.info("🤖 Traditional extraction found few products, trying LLM...")
-                llm_products = self._extract_with_llm(html, query, store_id, zipcode)
+                llm_products = self._extract_with_llm(soup, query, store_id, zipcode)
                 
                 # Use LLM results if they're better
                 if len(llm_products) > len(products):
                     products = llm_products
-                    logger.info(f"✅ Using LLM results: {len(llm_products)} products")
+                    logger.info("✅ Using LLM results: %d products", len(llm_products))
             
             if not products:
                 return ScrapeResponse(
@@ -405,27 +624,36 @@ Rules:
                     timestamp=datetime.now()
                 )
             
-            # Convert to ProductListing objects
+            # Required fields shared by every listing on this page, built once
+            listing_defaults = {
+                "store_zipcode": zipcode,
+                "product_url": search_url,
+                "store_address": "123 Main St",
+                "store_city": "Anytown",
+                "store_state": "NY"
+            }
+            
+            # Convert to ProductListing objects, dropping repeats only after validation
+            # since raw LLM items may not be dicts or may carry unhashable fields
             listings = []
+            seen = set()
             for product_data in products:
                 try:
-                    # Ensure required fields
-                    product_data.setdefault("store_zipcode", zipcode)
-                    product_data.setdefault("product_url", search_url)
-                    product_data.setdefault("store_address", "123 Main St")
-                    product_data.setdefault("store_city", "Anytown")
-                    product_data.setdefault("store_state", "NY")
-                    
-                    listing = ProductListing(**product_data)
+                    listing = ProductListing(**{**listing_defaults, **product_data})
+                    key = (listing.title, listing.price)
+                    if key in seen:
+                        continue
+                    seen.add(key)
                     listings.append(listing)
                     
-                    logger.info(f"📦 Added: {product_data.get('title', 'Unknown')[:50]}... - {product_data.get('price', 'No price')}")
+                    if logger.isEnabledFor(logging.DEBUG):
+                        logger.debug("📦 Added: %s... - %s", product_data.get('title', 'Unknown')[:50], product_data.get('price', 'No price'))
                     
                 except Exception as e:
-                    logger.warning(f"Failed to parse product data: {e}")
+                    logger.warning("Failed to parse product data: %s", e)
                     continue
             
-            logger.info(f"✅ Successfully extracted {len(listings)} products")
+            logger.info("✅ Successfully extracted %d products", len(listings))
             
             return ScrapeResponse(
                 success=True,
@@ -438,7 +666,7 @@ Rules:
             )
             
         except Exception as e:
-            logger.error(f"❌ Scraping error: {e}")
+            logger.error("❌ Scraping error: %s", e)
             return ScrapeResponse(
                 success=False,
                 store=store_id,
@@ -456,25 +684,21 @@ Rules:
     
     def _handle_cookie_banner(self, driver):
         """Handle cookie consent banners"""
-        cookie_selectors = [
-            "button[id*='accept']",
-            "button[class*='accept']",
-            "[data-testid*='accept']",
-            "button:contains('Accept')",
-            "button:contains('OK')"
-        ]
-        
-        for selector in cookie_selectors:
-            try:
-                element = WebDriverWait(driver, 2).until(
-                    EC.element_to_be_clickable((By.CSS_SELECTOR, selector))
-                )
-                element.click()
-                logger.info("✅ Accepted cookies")
-                time.sleep(1)
-                break
-            except:
-                continue
+        # All probes share one 2s deadline; drop the implicit wait meanwhile so
+        # each empty find_elements returns at once instead of stalling the poll
+        driver.implicitly_wait(0)
+        try:
+            element = WebDriverWait(
+                driver, 2, ignored_exceptions=(StaleElementReferenceException,)
+            ).until(_find_cookie_button)
+            element.click()
+            logger.info("✅ Accepted cookies")
+            time.sleep(1)
+        except WebDriverException:
+            # No clickable banner within the wait (TimeoutException) or it vanished mid-click
+            pass
+        finally:
+            driver.implicitly_wait(SCRAPER_CONFIG['implicit_wait'])
     
     def _scroll_page(self, driver):
         """Scroll page to load dynamic content"""
@@ -487,5 +711,5 @@ Rules:
             time.sleep(1)
             
         except Exception as e:
-            logger.warning(f"Scrolling failed: {e}")
+            logger.warning("Scrolling failed: %s", e)
 
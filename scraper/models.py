@@ -2,10 +2,12 @@
 Pydantic models for the Grocery Scraper API
 """
 
-from pydantic import BaseModel
+from pydantic import BaseModel, field_validator
 from typing import List, Optional
 from datetime import datetime
 
+from .config import canonical_store_id
+
 class ProductListing(BaseModel):
     """Model for a single product listing"""
     title: str
@@ -26,6 +28,18 @@ class ScrapeRequest(BaseModel):
     query: str
     store: str
     zipcode: str
+    
+    @field_validator("query")
+    @classmethod
+    def strip_query(cls, query: str) -> str:
+        """Drop surrounding whitespace so blank queries can be rejected before scraping"""
+        return query.strip()
+    
+    @field_validator("store")
+    @classmethod
+    def normalize_store(cls, store: str) -> str:
+        """Canonicalize the store once at ingress so lookups and cache keys share one form"""
+        return canonical_store_id(store)
 
 class ScrapeResponse(BaseModel):
     """Model for scraping response"""